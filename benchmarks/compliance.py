@@ -0,0 +1,36 @@
+def _total(doc):
+    # rule 3: if total price is not mentioned calculate it
+    if doc.get("total_price") is not None:
+        return float(doc["total_price"])
+    return round(sum(p.get("quantity", 0) * p.get("unit_price", 0.0) for p in doc.get("products", [])), 2)
+
+def check_order_compliance(order_id, invoice=None, purchase_order=None, order_summary=None, tolerance=0.01):
+    """
+    Deterministic version of the rules in compliance_check.txt, used as the compliance-checking
+    stage of the benchmark (the LLM path can't be timed reproducibly).
+    Returns {"order_id", "rules": [bool, bool, bool], "status": "PASS" | "FAIL"}.
+    """
+    has_all_documents = all(d is not None for d in (invoice, purchase_order, order_summary))
+
+    same_customer = False
+    if invoice is not None and purchase_order is not None:
+        same_customer = invoice.get("customer_details", {}).get("contact_name") == purchase_order.get("customer_name")
+
+    same_total = False
+    if has_all_documents:
+        totals = [_total(invoice), _total(purchase_order), _total(order_summary)]
+        same_total = max(totals) - min(totals) <= tolerance
+
+    rules = [has_all_documents, same_customer, same_total]
+    return {"order_id": order_id, "rules": rules, "status": "PASS" if all(rules) else "FAIL"}
+
+def group_by_order(documents_by_type):
+    """documents_by_type: {"invoice": [...], "purchase_order": [...], "order_summary": [...]} as stored in output_folder."""
+    by_order = {}
+    for doc_type, docs in documents_by_type.items():
+        for doc in docs:
+            by_order.setdefault(str(doc.get("order_id")), {})[doc_type] = doc
+    return by_order
+
+def check_all(documents_by_type):
+    return [check_order_compliance(order_id, **docs) for order_id, docs in group_by_order(documents_by_type).items()]
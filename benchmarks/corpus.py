@@ -0,0 +1,216 @@
+import os
+import json
+import random
+
+CUSTOMERS = [
+    {"customer_id": "HANAR", "customer_name": "Hanari Carnes", "contact_name": "Mario Pontes", "address": "Rua do Paço, 67",
+     "city": "Rio de Janeiro", "postal_code": "05454-876", "country": "Brazil", "region": "South America",
+     "phone": "(21) 555-0091", "fax": "(21) 555-8765"},
+    {"customer_id": "VINET", "customer_name": "Vins et alcools Chevalier", "contact_name": "Paul Henriot", "address": "59 rue de l'Abbaye",
+     "city": "Reims", "postal_code": "51100", "country": "France", "region": "Western Europe",
+     "phone": "26.47.15.10", "fax": "26.47.15.11"},
+    {"customer_id": "TOMSP", "customer_name": "Toms Spezialitäten", "contact_name": "Karin Josephs", "address": "Luisenstr. 48",
+     "city": "Münster", "postal_code": "44087", "country": "Germany", "region": "Western Europe",
+     "phone": "0251-031259", "fax": "0251-035695"},
+    {"customer_id": "SUPRD", "customer_name": "Suprêmes délices", "contact_name": "Pascale Cartrain", "address": "Boulevard Tirou, 255",
+     "city": "Charleroi", "postal_code": "B-6000", "country": "Belgium", "region": "Western Europe",
+     "phone": "(071) 23 67 22 20", "fax": "(071) 23 67 22 21"},
+    {"customer_id": "CHOPS", "customer_name": "Chop-suey Chinese", "contact_name": "Yang Wang", "address": "Hauptstr. 29",
+     "city": "Bern", "postal_code": "3012", "country": "Switzerland", "region": "Western Europe",
+     "phone": "0452-076545", "fax": "0452-076546"},
+    {"customer_id": "RATTC", "customer_name": "Rattlesnake Canyon Grocery", "contact_name": "Paula Wilson", "address": "2817 Milton Dr.",
+     "city": "Albuquerque", "postal_code": "87110", "country": "USA", "region": "North America",
+     "phone": "(505) 555-5939", "fax": "(505) 555-3620"},
+]
+
+PRODUCTS = [
+    ("11", "Queso Cabrales", 14.0), ("14", "Tofu", 18.6), ("22", "Gustaf's Knäckebröd", 16.8),
+    ("41", "Jack's New England Clam Chowder", 7.7), ("42", "Singaporean Hokkien Fried Mee", 9.8),
+    ("51", "Manjimup Dried Apples", 42.4), ("57", "Ravioli Angelo", 15.6), ("60", "Camembert Pierrot", 27.2),
+    ("65", "Louisiana Fiery Hot Pepper Sauce", 16.8), ("72", "Mozzarella di Giovanni", 27.8),
+]
+
+EMPLOYEES = ["Margaret Peacock", "Nancy Davolio", "Janet Leverling", "Steven Buchanan", "Michael Suyama"]
+SHIPPERS = [("1", "Speedy Express"), ("2", "United Package"), ("3", "Federal Shipping")]
+
+# Ways a generated order can break the rules in compliance_check.txt
+VIOLATIONS = ("missing_document", "customer_mismatch", "total_mismatch")
+
+def generate_order(rng, order_id, noncompliant_rate=0.2, max_products=5):
+    """Random order with the fields each document type carries, plus the rule it violates (if any)."""
+    customer = rng.choice(CUSTOMERS)
+    products = [
+        {"product_id": pid, "product_name": name, "quantity": rng.randint(1, 60), "unit_price": price}
+        for pid, name, price in rng.sample(PRODUCTS, rng.randint(1, max_products))
+    ]
+    order_date = f"2016-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    shipper = rng.choice(SHIPPERS)
+    violation = rng.choice(VIOLATIONS) if rng.random() < noncompliant_rate else None
+    return {
+        "order_id": str(order_id),
+        "customer": customer,
+        "products": products,
+        "order_date": order_date,
+        "shipped_date": order_date[:8] + f"{min(int(order_date[8:]) + rng.randint(1, 3), 28):02d}",
+        "employee_name": rng.choice(EMPLOYEES),
+        "shipper_id": shipper[0],
+        "shipper_name": shipper[1],
+        "violation": violation,
+    }
+
+def _total(products):
+    return round(sum(p["quantity"] * p["unit_price"] for p in products), 2)
+
+def invoice_lines(order):
+    c = order["customer"]
+    lines = [
+        "Invoice",
+        f"Order ID: {order['order_id']}",
+        f"Customer ID: {c['customer_id']}",
+        f"Order Date: {order['order_date']}",
+        "Customer Details:",
+        f"Contact Name: {c['contact_name']}",
+        f"Address: {c['address']}",
+        f"City: {c['city']}",
+        f"Postal Code: {c['postal_code']}",
+        f"Country: {c['country']}",
+        f"Phone: {c['phone']}",
+        f"Fax: {c['fax']}",
+        "Product Details:",
+    ]
+    table = [["Product ID", "Product Name", "Quantity", "Unit Price"]]
+    table += [[p["product_id"], p["product_name"], str(p["quantity"]), str(p["unit_price"])] for p in order["products"]]
+    total = _total(order["products"])
+    if order["violation"] == "total_mismatch":
+        total = round(total + 10.0, 2)
+    table.append(["", "", "TotalPrice", str(total)])
+    return lines, table
+
+def purchase_order_lines(order):
+    customer_name = order["customer"]["contact_name"]
+    if order["violation"] == "customer_mismatch":
+        customer_name = next(c["contact_name"] for c in CUSTOMERS if c["contact_name"] != customer_name)
+    lines = [
+        "Purchase Orders",
+        "Order ID Order Date Customer Name",
+        f"{order['order_id']} {order['order_date']} {customer_name}",
+        "Products",
+        "Product ID: Product: Quantity: Unit Price:",
+    ]
+    lines += [f"{p['product_id']} {p['product_name']} {p['quantity']} {p['unit_price']}" for p in order["products"]]
+    return lines
+
+def order_summary_lines(order):
+    c = order["customer"]
+    lines = [
+        f"Order ID: {order['order_id']}",
+        "Shipping Details:",
+        f"Ship Name: {c['customer_name']}",
+        f"Ship Address: {c['address']}",
+        f"Ship City: {c['city']}",
+        f"Ship Region: {c['region']}",
+        f"Ship Postal Code: {c['postal_code']}",
+        f"Ship Country: {c['country']}",
+        "Customer Details:",
+        f"Customer ID: {c['customer_id']}",
+        f"Customer Name: {c['customer_name']}",
+        "Employee Details:",
+        f"Employee Name: {order['employee_name']}",
+        "Shipper Details:",
+        f"Shipper ID: {order['shipper_id']}",
+        f"Shipper Name: {order['shipper_name']}",
+        "Order Details:",
+        f"Order Date: {order['order_date']}",
+        f"Shipped Date: {order['shipped_date']}",
+        "Products:",
+    ]
+    for p in order["products"]:
+        lines += [
+            "-" * 40,
+            f"Product: {p['product_name']}",
+            f"Quantity: {p['quantity']}",
+            f"Unit Price: {p['unit_price']}",
+            f"Total: {round(p['quantity'] * p['unit_price'], 2)}",
+        ]
+    lines.append(f"Total Price: {_total(order['products'])}")
+    return lines
+
+def extracted_documents(order):
+    """
+    Documents of an order in the shape extract_text_and_tables_from_pdf returns,
+    as (file stem, {"text", "tables"}) pairs.
+    """
+    docs = []
+    inv_lines, inv_table = invoice_lines(order)
+    inv_text = "\n".join(inv_lines + [" ".join(row).strip() for row in inv_table] + ["Page 1"])
+    docs.append((f"invoice_{order['order_id']}", {
+        "text": f"--- Page 1 ---\n{inv_text}",
+        "tables": [{"page": 1, "table": inv_table}],
+    }))
+    if order["violation"] != "missing_document":
+        po_text = "\n".join(purchase_order_lines(order) + ["Page 1"])
+        docs.append((f"purchase_orders_{order['order_id']}", {"text": f"--- Page 1 ---\n{po_text}", "tables": []}))
+    os_text = "\n".join(order_summary_lines(order))
+    docs.append((f"order_{order['order_id']}", {"text": f"--- Page 1 ---\n{os_text}", "tables": []}))
+    return docs
+
+def render_pdf(path, lines, table=None):
+    """Writes the lines (and an optional gridded table, so pdfplumber detects it) to a one-page PDF."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from reportlab.platypus import Table, TableStyle
+    from reportlab.lib import colors
+
+    pdf = canvas.Canvas(path, pagesize=A4)
+    width, height = A4
+    y = height - 40
+    for line in lines:
+        pdf.drawString(40, y, line)
+        y -= 14
+    if table:
+        tbl = Table(table)
+        tbl.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)]))
+        _, tbl_height = tbl.wrapOn(pdf, width - 80, y)
+        tbl.drawOn(pdf, 40, y - tbl_height)
+        y -= tbl_height + 14
+    pdf.drawString(width / 2, 20, "Page 1")
+    pdf.save()
+
+def generate_corpus(out_dir, n_orders, seed=0, noncompliant_rate=0.2, pdf=True, first_order_id=20000):
+    """
+    Generates `n_orders` orders (an invoice, purchase order and order summary each) under out_dir:
+      pdf/<stem>.pdf        - rendered documents (if pdf=True)
+      text/<stem>.json      - extracted-text equivalents ({"text", "tables"})
+      manifest.json         - ground truth per order: violation (or null) and document stems
+    Returns the manifest.
+    """
+    rng = random.Random(seed)
+    text_dir = os.path.join(out_dir, "text")
+    pdf_dir = os.path.join(out_dir, "pdf")
+    os.makedirs(text_dir, exist_ok=True)
+    if pdf:
+        os.makedirs(pdf_dir, exist_ok=True)
+
+    manifest = []
+    for i in range(n_orders):
+        order = generate_order(rng, first_order_id + i, noncompliant_rate)
+        docs = extracted_documents(order)
+        for stem, extracted in docs:
+            with open(os.path.join(text_dir, f"{stem}.json"), "w", encoding="utf-8") as f:
+                json.dump(extracted, f)
+        if pdf:
+            inv_lines, inv_table = invoice_lines(order)
+            render_pdf(os.path.join(pdf_dir, f"invoice_{order['order_id']}.pdf"), inv_lines, inv_table)
+            if order["violation"] != "missing_document":
+                render_pdf(os.path.join(pdf_dir, f"purchase_orders_{order['order_id']}.pdf"), purchase_order_lines(order))
+            render_pdf(os.path.join(pdf_dir, f"order_{order['order_id']}.pdf"), order_summary_lines(order))
+        manifest.append({"order_id": order["order_id"], "violation": order["violation"],
+                         "documents": [stem for stem, _ in docs]})
+
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+if __name__ == "__main__":
+    manifest = generate_corpus(os.path.join("benchmarks", "corpus"), n_orders=1000)
+    print(f"Generated {len(manifest)} orders")
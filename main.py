@@ -8,6 +8,7 @@ from parser.unified_parser import parse_invoice_text
 from parser.unified_parser import parse_purchase_order_text
 from parser.unified_parser import parse_order_summary_text
 from save_json import save_document_data
+from metrics import Metrics, DocumentProfiler
 
 @contextlib.contextmanager
 def suppress_stdout_stderr():
@@ -47,37 +48,76 @@ def load_existing_order_ids(output_folder):
                 continue
     return order_ids
 
-def main():
-    input_folder = "input_folder"
-    output_folder = "output_folder"
+def process_file(path, output_folder, metrics):
+    with metrics.span("extract", path):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            with suppress_stdout_stderr():
+                result = extract_text_and_tables_from_pdf(path)
+
+    with metrics.span("detect", path):
+        doc_type = detect_document_type(result["text"])
+
+    if doc_type == "unknown":
+        metrics.incr("files_skipped", reason="unknown_type")
+        return
+
+    with metrics.span("parse", path):
+        if doc_type == "invoice":
+            parsed = parse_invoice_text(result["text"], result["tables"])
+        elif doc_type == "purchase_order":
+            parsed = parse_purchase_order_text(result["text"], result["tables"])
+        else:
+            parsed = parse_order_summary_text(result["text"])
+
+    if not parsed:
+        metrics.incr("files_skipped", reason="empty_parse")
+        return
+
+    parsed["type"] = doc_type
+    with metrics.span("save", path):
+        action = save_document_data(doc_type.replace('_', ' '), parsed, output_folder)
+    metrics.incr("documents_saved", type=doc_type, action=action)
+
+def main(input_folder="input_folder", output_folder="output_folder", metrics_dir="metrics", profile_top_n=0):
+    """
+    Extracts, classifies, parses and saves every PDF in input_folder.
+    Per-file/stage timings and skip/error counters are written to metrics_dir as JSON and
+    Prometheus text; profile_top_n > 0 also writes cProfile/tracemalloc profiles of the
+    slowest documents to metrics_dir/profiles. Profiled files are counted as files_profiled,
+    as their span timings include the profiler overhead and aren't comparable to normal runs.
+    """
     os.makedirs(output_folder, exist_ok=True)
+    metrics = Metrics()
+    profiler = DocumentProfiler(top_n=profile_top_n, out_dir=os.path.join(metrics_dir, "profiles")) if profile_top_n else None
 
     for filename in os.listdir(input_folder):
-        if filename.endswith(".pdf"):
-            path = os.path.join(input_folder, filename)
-
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                with suppress_stdout_stderr():
-                    result = extract_text_and_tables_from_pdf(path)
-
-            doc_type = detect_document_type(result["text"])
-            parsed = None
-
-            if doc_type == "invoice":
-                parsed = parse_invoice_text(result["text"], result["tables"])
-            elif doc_type == "purchase_order":
-                parsed = parse_purchase_order_text(result["text"], result["tables"])
-            elif doc_type == "order_summary":
-                parsed = parse_order_summary_text(result["text"])
-            else:
-                continue
+        metrics.incr("files_seen")
+        if not filename.endswith(".pdf"):
+            metrics.incr("files_skipped", reason="not_pdf")
+            continue
+        path = os.path.join(input_folder, filename)
+
+        try:
+            # errors are counted by the inner stage spans; files_failed counts the file
+            with metrics.span("file", path, count_errors=False):
+                if profiler is not None:
+                    metrics.incr("files_profiled")
+                    with profiler.profile(path):
+                        process_file(path, output_folder, metrics)
+                else:
+                    process_file(path, output_folder, metrics)
+        except Exception as e:
+            metrics.incr("files_failed")
+            print(f"❌ Failed to process {filename}: {e}")
 
-            if parsed:
-                parsed["type"] = doc_type
-                save_document_data(doc_type.replace('_', ' '), parsed, output_folder)
+    json_path, prom_path = metrics.dump(metrics_dir, prefix="ingestion")
+    print(f"📊 Metrics written to {json_path} and {prom_path}")
+    if profiler is not None:
+        paths = profiler.write()
+        print(f"🔬 Wrote {len(paths)} profiles to {profiler.out_dir}")
 
 
 
 if __name__ == "__main__":
-    main()
+    main(profile_top_n=int(os.environ.get("PROFILE_TOP_N", "0")))
@@ -0,0 +1,151 @@
+import os
+import json
+import time
+import heapq
+import cProfile
+import contextlib
+import tracemalloc
+
+class Metrics:
+    """
+    In-process timing spans and counters for the ingestion and QA pipelines,
+    dumped as JSON or Prometheus text format.
+    """
+
+    def __init__(self, namespace="compliance"):
+        self.namespace = namespace
+        self.counters = {}      # (name, sorted label items) -> value
+        self.stage_timings = {}  # stage -> [seconds, ...]
+        self.file_timings = {}   # file -> {stage: seconds}
+
+    def incr(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextlib.contextmanager
+    def span(self, stage, file=None, count_errors=True):
+        """
+        Times the block under `stage` (and `file` if given); errors are counted and re-raised.
+        Outer spans wrapping other spans should pass count_errors=False so an error is counted once.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            if count_errors:
+                self.incr("errors", stage=stage)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_timings.setdefault(stage, []).append(elapsed)
+            if file is not None:
+                stages = self.file_timings.setdefault(file, {})
+                stages[stage] = stages.get(stage, 0.0) + elapsed
+
+    def to_dict(self):
+        stages = {}
+        for stage, timings in self.stage_timings.items():
+            ordered = sorted(timings)
+            stages[stage] = {
+                "count": len(ordered),
+                "sum_seconds": sum(ordered),
+                "max_seconds": ordered[-1],
+                "p50_seconds": ordered[len(ordered) // 2],
+                "p95_seconds": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            }
+        counters = [{"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())]
+        return {"stages": stages, "counters": counters, "files": self.file_timings}
+
+    def to_prometheus(self):
+        lines = []
+        seen = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            metric = f"{self.namespace}_{name}_total"
+            if metric not in seen:
+                lines.append(f"# TYPE {metric} counter")
+                seen.add(metric)
+            lines.append(f"{metric}{_prom_labels(labels)} {value}")
+        metric = f"{self.namespace}_stage_duration_seconds"
+        if self.stage_timings:
+            lines.append(f"# TYPE {metric} summary")
+        for stage, timings in sorted(self.stage_timings.items()):
+            ordered = sorted(timings)
+            for q in (0.5, 0.95):
+                value = ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+                lines.append(f'{metric}{_prom_labels((("quantile", str(q)), ("stage", stage)))} {value}')
+            lines.append(f'{metric}_sum{_prom_labels((("stage", stage),))} {sum(ordered)}')
+            lines.append(f'{metric}_count{_prom_labels((("stage", stage),))} {len(ordered)}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, metrics_dir="metrics", prefix="metrics"):
+        """Writes <prefix>.json and <prefix>.prom under metrics_dir and returns their paths."""
+        os.makedirs(metrics_dir, exist_ok=True)
+        json_path = os.path.join(metrics_dir, f"{prefix}.json")
+        prom_path = os.path.join(metrics_dir, f"{prefix}.prom")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=4)
+        with open(prom_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        return json_path, prom_path
+
+def _prom_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+class DocumentProfiler:
+    """
+    Opt-in cProfile + tracemalloc hook: profiles every document but only keeps
+    the slowest `top_n`, then writes a .prof file and a memory report for each.
+    """
+
+    def __init__(self, top_n=5, out_dir="profiles", memory_frames=10):
+        self.top_n = top_n
+        self.out_dir = out_dir
+        self.memory_frames = memory_frames
+        self._slowest = []  # min-heap of (seconds, counter, file, profile, memory stats)
+        self._counter = 0
+
+    @contextlib.contextmanager
+    def profile(self, file):
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            memory_stats = tracemalloc.take_snapshot().compare_to(before, "lineno")[:self.memory_frames]
+            if started_tracing:
+                tracemalloc.stop()
+            self._counter += 1
+            entry = (elapsed, self._counter, file, profiler, memory_stats)
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, entry)
+            elif elapsed > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def write(self):
+        """Writes the kept profiles, slowest first, and returns the .prof paths."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        paths = []
+        for rank, (elapsed, _, file, profiler, memory_stats) in enumerate(sorted(self._slowest, reverse=True), start=1):
+            stem = f"{rank:02d}_{os.path.basename(file)}"
+            prof_path = os.path.join(self.out_dir, f"{stem}.prof")
+            profiler.dump_stats(prof_path)
+            with open(os.path.join(self.out_dir, f"{stem}.memory.txt"), "w", encoding="utf-8") as f:
+                f.write(f"{file}: {elapsed:.4f}s\n")
+                for stat in memory_stats:
+                    f.write(f"{stat}\n")
+            paths.append(prof_path)
+        return paths
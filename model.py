@@ -4,6 +4,7 @@ from langchain_ollama import OllamaLLM, OllamaEmbeddings
 from langchain_community.vectorstores import Chroma
 from langchain.chains import RetrievalQA
 from model.format import load_json_documents
+from metrics import Metrics
 
 def load_compliance_rules(file_path="compliance_check.txt"):
     try:
@@ -30,14 +31,24 @@ def reset_and_create_vectorstore(documents, embedding, persist_dir="chroma_store
 
     return vectordb
 
-def main():
+def main(metrics_dir="metrics"):
+    metrics = Metrics()
+    try:
+        run_session(metrics)
+    finally:
+        # also on early returns, Ctrl-C, EOF and crashes, where the metrics matter most
+        json_path, prom_path = metrics.dump(metrics_dir, prefix="qa")
+        print(f"📊 Metrics written to {json_path} and {prom_path}")
+
+def run_session(metrics):
     print("⚙️ Starting fresh LLM-based QA session...\n")
 
     folder_path = "output_folder"
     persist_dir = "chroma_store"
 
     # Load documents
-    documents = load_json_documents(folder_path)
+    with metrics.span("load"):
+        documents = load_json_documents(folder_path)
     print(f"✅ Loaded {len(documents)} documents from JSON files.")
 
     if not documents:
@@ -55,7 +66,8 @@ def main():
     embedding = OllamaEmbeddings(model="llama3.1")
 
     # Reset vectorstore and create from current documents
-    vectordb = reset_and_create_vectorstore(documents, embedding, persist_dir=persist_dir)
+    with metrics.span("embed"):
+        vectordb = reset_and_create_vectorstore(documents, embedding, persist_dir=persist_dir)
     retriever = vectordb.as_retriever(search_kwargs={"k": 9})
 
     # Set up QA chain
@@ -82,7 +94,9 @@ Always refer to the specific document source where the value was found.
             shutil.rmtree(persist_dir, ignore_errors=True)
             break
         if not user_query:
+            metrics.incr("queries_skipped", reason="empty")
             continue
+        metrics.incr("queries", compliance="compliance" in user_query.lower())
 
         try:
             if "compliance" in user_query.lower():
@@ -90,12 +104,14 @@ Always refer to the specific document source where the value was found.
             else:
                 prompt = system_prefix + "\n\nUser Query: " + user_query
 
-            docs = retriever.invoke(prompt)
+            with metrics.span("retrieve"):
+                docs = retriever.invoke(prompt)
             print(f"📦 Retrieved {len(docs)} relevant documents:")
             for doc in docs:
                 print(f" - Source: {doc.metadata.get('source')}")
 
-            answer = qa.invoke(prompt)
+            with metrics.span("generate"):
+                answer = qa.invoke(prompt)
             print("\n📄 Result:\n" + answer["result"] + "\n")
 
         except Exception as e:
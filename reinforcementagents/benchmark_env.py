@@ -0,0 +1,41 @@
+# benchmark_env.py
+import time
+import numpy as np
+from gym import spaces
+from stable_baselines3.common.vec_env import DummyVecEnv
+from r1_agent.env import DocumentComplianceEnv, DocumentComplianceEnvContinuous
+from r1_agent.vec_env import BatchedDocumentComplianceVecEnv, BatchedDocumentComplianceVecEnvContinuous
+
+def steps_per_second(vec_env, n_steps=2_000, seed=0):
+    """Steps the vec env with random actions and returns env transitions per second."""
+    rng = np.random.RandomState(seed)
+    n = vec_env.num_envs
+    vec_env.reset()
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        if isinstance(vec_env.action_space, spaces.Discrete):
+            actions = rng.randint(0, 2, size=n)
+        else:
+            actions = rng.rand(n, 1).astype(np.float32)
+        vec_env.step(actions)
+    elapsed = time.perf_counter() - start
+    vec_env.close()
+    return n_steps * n / elapsed
+
+def run(num_envs=(1, 8, 64, 256), n_steps=2_000):
+    results = []
+    for n in num_envs:
+        for name, dummy, batched in [
+            ("binary", DocumentComplianceEnv, BatchedDocumentComplianceVecEnv),
+            ("continuous", DocumentComplianceEnvContinuous, BatchedDocumentComplianceVecEnvContinuous),
+        ]:
+            dummy_sps = steps_per_second(DummyVecEnv([lambda i=i: dummy(seed=i) for i in range(n)]), n_steps)
+            batched_sps = steps_per_second(batched(num_envs=n, seed=0), n_steps)
+            results.append({"env": name, "num_envs": n, "dummy_sps": dummy_sps,
+                            "batched_sps": batched_sps, "speedup": batched_sps / dummy_sps})
+            print(f"{name:<10} n_envs={n:<4} DummyVecEnv: {dummy_sps:>12,.0f} steps/s  "
+                  f"Batched: {batched_sps:>12,.0f} steps/s  speedup x{batched_sps / dummy_sps:.1f}")
+    return results
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,50 @@
+# benchmark_inference.py
+import os
+import time
+import tempfile
+import numpy as np
+from stable_baselines3 import PPO
+from r1_agent.env import sample_synthetic_batch
+from r1_agent.train_binary import train
+from r1_agent.train_multi import PolicyRegistry, inference_binary, inference_binary_batch
+
+def decisions_per_second(fn, n_decisions):
+    start = time.perf_counter()
+    fn()
+    return n_decisions / (time.perf_counter() - start)
+
+def run(model_path="models/binary_agent.zip", n_docs=10_000, n_reload=50, batch_size=1_024):
+    if not os.path.exists(model_path):
+        # throwaway policy for timing only, never written over the real models/ directory
+        model_path = os.path.join(tempfile.mkdtemp(prefix="benchmark_inference_"), "binary_agent.zip")
+        train(save_path=model_path, total_timesteps=2_048)
+    obs, _ = sample_synthetic_batch(np.random.RandomState(0), n_docs)
+
+    def reload_each_call():
+        # previous behaviour: PPO.load on every decision
+        for o in obs[:n_reload]:
+            model = PPO.load(model_path)
+            model.predict(o, deterministic=True)
+
+    registry = PolicyRegistry()
+    registry.get(model_path, PPO)
+
+    def registry_single():
+        for o in obs:
+            inference_binary(model_path, o, registry=registry)
+
+    def registry_batched():
+        for i in range(0, n_docs, batch_size):
+            inference_binary_batch(model_path, obs[i:i + batch_size], registry=registry)
+
+    results = {
+        "reload_each_call": decisions_per_second(reload_each_call, n_reload),
+        "registry_single": decisions_per_second(registry_single, n_docs),
+        "registry_batched": decisions_per_second(registry_batched, n_docs),
+    }
+    for name, dps in results.items():
+        print(f"{name:<18} {dps:>12,.0f} decisions/s")
+    return results
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,113 @@
+# dataset.py
+import os
+import hashlib
+import zipfile
+import tempfile
+import numpy as np
+from r1_agent.env import DOC_TYPES, OBS_DIM, build_observation_array
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "compliance_datasets")
+
+def _file_hash(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def csv_to_arrays(csv_path, n_missing_fields_max=10):
+    """
+    Converts the real-data CSV into a contiguous float32 observation matrix and a label vector.
+    Expect columns: model_pred, model_conf, missing_fields, doc_type (str), hist_success, label (0/1)
+    """
+    import pandas as pd
+    df = pd.read_csv(csv_path)
+    doc_type_idx = df['doc_type'].map(lambda x: DOC_TYPES.index(x) if x in DOC_TYPES else 0).to_numpy()
+    obs = build_observation_array(
+        df['model_pred'].to_numpy(dtype=np.float32),
+        df['model_conf'].to_numpy(dtype=np.float32),
+        # Normalize missing_fields -> /n_missing_fields_max if larger
+        df['missing_fields'].clip(0, n_missing_fields_max).to_numpy(dtype=np.float32) / n_missing_fields_max,
+        doc_type_idx,
+        df['hist_success'].to_numpy(dtype=np.float32),
+    )
+    labels = df['label'].to_numpy(dtype=np.int64)
+    return obs, labels
+
+def _mmap_npz_member(path, name):
+    # np.load ignores mmap_mode for .npz, so map uncompressed members directly;
+    # compressed members can't be mapped and are read into memory instead.
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name + ".npy")
+        if info.compress_type != zipfile.ZIP_STORED:
+            with zf.open(info) as f:
+                return np.lib.format.read_array(f)
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        local_header = f.read(30)
+        name_len = int.from_bytes(local_header[26:28], "little")
+        extra_len = int.from_bytes(local_header[28:30], "little")
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape, offset=offset,
+                     order="F" if fortran_order else "C")
+
+def load_arrays(path):
+    """
+    Loads a preprocessed dataset without reading it into RAM:
+      - .npz with "obs" (N, OBS_DIM) and "labels" (N,) arrays
+      - .npy with an (N, OBS_DIM + 1) matrix whose last column is the label
+    """
+    if path.endswith(".npz"):
+        obs = _mmap_npz_member(path, "obs")
+        labels = _mmap_npz_member(path, "labels")
+    elif path.endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        obs, labels = data[:, :-1], data[:, -1]
+    else:
+        raise ValueError(f"Unsupported dataset format: {path}")
+    if obs.ndim != 2 or obs.shape[1] != OBS_DIM or len(labels) != len(obs):
+        raise ValueError(f"Expected obs of shape (N, {OBS_DIM}) and N labels in {path}, got {obs.shape} and {labels.shape}")
+    return obs, labels
+
+def load_real_dataset(path, n_missing_fields_max=10, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Returns (obs, labels) arrays for a real dataset.
+    CSVs are converted once and cached on disk keyed by the CSV hash, so later loads
+    just memory-map the cached arrays; .npy/.npz datasets are memory-mapped directly.
+    """
+    if not path.endswith(".csv"):
+        return load_arrays(path)
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, f"{_file_hash(path)}_{n_missing_fields_max}.npz")
+        if os.path.exists(cache_path):
+            return load_arrays(cache_path)
+    obs, labels = csv_to_arrays(path, n_missing_fields_max)
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # unique temp file per loader: several processes (e.g. SubprocVecEnv workers)
+        # can miss the cache at once and must not write into or rename each other's file
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".npz", delete=False) as tmp:
+            tmp_path = tmp.name
+        try:
+            np.savez(tmp_path, obs=obs, labels=labels)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            # lost the race to another loader: its cache is just as good
+            if os.path.exists(cache_path):
+                return load_arrays(cache_path)
+            raise
+    return obs, labels
+
+def sample_batch(rng, obs, labels, n):
+    """Vectorized index draw of `n` (obs, label) pairs from the dataset arrays."""
+    idx = rng.randint(0, len(labels), size=n)
+    return np.ascontiguousarray(obs[idx], dtype=np.float32), np.asarray(labels[idx], dtype=np.int64)
@@ -2,7 +2,6 @@
 import gym
 from gym import spaces
 import numpy as np
-import pandas as pd
 
 # Utility: one-hot for doc type
 DOC_TYPES = ["invoice", "po", "grn"]
@@ -12,6 +11,62 @@ def doc_type_one_hot(doc_type_idx):
     vec[doc_type_idx] = 1.0
     return vec
 
+# observation: model_pred (1), confidence (1), missing_fields (1), doc_type one-hot (len(DOC_TYPES)), hist_success (1)
+OBS_DIM = 1 + 1 + 1 + len(DOC_TYPES) + 1
+
+def build_observation_array(model_pred, model_conf, missing_norm, doc_type_idx, hist_success):
+    """
+    Batched observation layout shared by the batched env, the real-data loader and inference:
+    every argument is a length-N array, returns an (N, OBS_DIM) float32 array.
+    """
+    doc_type_idx = np.asarray(doc_type_idx, dtype=np.int64)
+    n = len(doc_type_idx)
+    obs = np.zeros((n, OBS_DIM), dtype=np.float32)
+    obs[:, 0] = model_pred
+    obs[:, 1] = model_conf
+    obs[:, 2] = missing_norm
+    obs[np.arange(n), 3 + doc_type_idx] = 1.0
+    obs[:, -1] = hist_success
+    return obs
+
+def sample_synthetic_batch(rng, n, n_missing_fields_max=10):
+    """
+    Vectorized version of the per-env `_sample_synthetic`: draws `n` observations
+    and labels in one go with the same distributions.
+    Returns (obs (n, OBS_DIM) float32, labels (n,) int64).
+    """
+    model_conf = rng.beta(2, 1, size=n)
+    missing_norm = rng.randint(0, n_missing_fields_max + 1, size=n) / n_missing_fields_max
+    doc_type_idx = rng.randint(0, len(DOC_TYPES), size=n)
+    # one draw for hist_success and the label coin: each RNG call has a fixed cost that dominates at small n
+    hist_success, label_draw = rng.rand(2, n)
+
+    prob_compliant = 0.5 * model_conf + 0.3 * (1 - missing_norm) + 0.2 * hist_success
+    labels = (label_draw < prob_compliant).astype(np.int64)
+
+    obs = build_observation_array(model_conf > 0.5, model_conf, missing_norm, doc_type_idx, hist_success)
+    return obs, labels
+
+# DocumentComplianceEnv.step rewards indexed by [action (0 review, 1 pass, 2 invalid), label]
+_BINARY_REWARDS = np.array([[1.0, 0.5], [-2.0, 1.0], [-1.0, -1.0]], dtype=np.float32)
+
+def binary_reward_batch(actions, labels):
+    """Vectorized reward of `DocumentComplianceEnv.step` for arrays of actions and labels."""
+    actions = np.asarray(actions).reshape(-1).astype(np.intp)
+    labels = np.asarray(labels).reshape(-1)
+    invalid = (actions < 0) | (actions > 1)
+    if invalid.any():
+        actions = np.where(invalid, 2, actions)
+    return _BINARY_REWARDS[actions, labels]
+
+def continuous_reward_batch(actions, labels):
+    """Vectorized reward of `DocumentComplianceEnvContinuous.step` for arrays of actions and labels."""
+    actions = np.clip(np.asarray(actions, dtype=np.float32).reshape(len(labels), -1)[:, 0], 0.0, 1.0)
+    labels = np.asarray(labels)
+    base_reward = 1.0 - np.abs(actions - labels)
+    penalty = -2.0 * ((actions > 0.7) & (labels == 0))
+    return (base_reward + penalty).astype(np.float32), actions
+
 class DocumentComplianceEnv(gym.Env):
     """
     Discrete-action environment:
@@ -38,17 +93,16 @@ class DocumentComplianceEnv(gym.Env):
         self.n_missing_fields_max = n_missing_fields_max
         self.current = None
         self.use_real_data = use_real_data
-        self.real_df = None
+        self.real_obs = None
+        self.real_labels = None
         if use_real_data is not None:
             self._load_real_data(use_real_data)
 
-    def _load_real_data(self, csv_path):
-        self.real_df = pd.read_csv(csv_path)
-        # Expect columns: model_pred, model_conf, missing_fields, doc_type (str), hist_success, label (0/1)
-        # Normalize missing_fields -> /n_missing_fields_max if larger
-        self.real_df['missing_fields'] = self.real_df['missing_fields'].clip(0, self.n_missing_fields_max) / self.n_missing_fields_max
-        # doc_type -> index
-        self.real_df['doc_type_idx'] = self.real_df['doc_type'].apply(lambda x: DOC_TYPES.index(x) if x in DOC_TYPES else 0)
+    def _load_real_data(self, path):
+        # CSV is converted once into a float32 obs matrix + label vector (cached on disk),
+        # .npy/.npz datasets are memory-mapped; see dataset.py
+        from r1_agent.dataset import load_real_dataset
+        self.real_obs, self.real_labels = load_real_dataset(path, self.n_missing_fields_max)
 
     def _sample_synthetic(self):
         # Sampling logic for synthetic training data
@@ -73,22 +127,15 @@ class DocumentComplianceEnv(gym.Env):
         ])
         return obs, true_label
 
-    def _sample_from_df(self):
-        idx = self.rng.randint(0, len(self.real_df))
-        row = self.real_df.iloc[idx]
-        obs = np.concatenate([
-            np.array([float(row['model_pred'])], dtype=np.float32),
-            np.array([float(row['model_conf'])], dtype=np.float32),
-            np.array([float(row['missing_fields'])], dtype=np.float32),
-            doc_type_one_hot(int(row['doc_type_idx'])),
-            np.array([float(row['hist_success'])], dtype=np.float32)
-        ])
-        true_label = int(row['label'])
+    def _sample_from_real(self):
+        idx = self.rng.randint(0, len(self.real_labels))
+        obs = np.array(self.real_obs[idx], dtype=np.float32)
+        true_label = int(self.real_labels[idx])
         return obs, true_label
 
     def reset(self):
-        if self.real_df is not None:
-            obs, label = self._sample_from_df()
+        if self.real_obs is not None:
+            obs, label = self._sample_from_real()
         else:
             obs, label = self._sample_synthetic()
         self.current = {"obs": obs, "label": label}
@@ -147,16 +194,15 @@ class DocumentComplianceEnvContinuous(gym.Env):
         self.n_missing_fields_max = n_missing_fields_max
         self.current = None
         self.use_real_data = use_real_data
-        self.real_df = None
+        self.real_obs = None
+        self.real_labels = None
         if use_real_data is not None:
             self._load_real_data(use_real_data)
 
-    def _load_real_data(self, csv_path):
+    def _load_real_data(self, path):
         # same as discrete env
-        import pandas as pd
-        self.real_df = pd.read_csv(csv_path)
-        self.real_df['missing_fields'] = self.real_df['missing_fields'].clip(0, self.n_missing_fields_max) / self.n_missing_fields_max
-        self.real_df['doc_type_idx'] = self.real_df['doc_type'].apply(lambda x: DOC_TYPES.index(x) if x in DOC_TYPES else 0)
+        from r1_agent.dataset import load_real_dataset
+        self.real_obs, self.real_labels = load_real_dataset(path, self.n_missing_fields_max)
 
     def _sample_synthetic(self):
         model_conf = self.rng.beta(2, 1)
@@ -176,22 +222,15 @@ class DocumentComplianceEnvContinuous(gym.Env):
         ])
         return obs, true_label
 
-    def _sample_from_df(self):
-        idx = self.rng.randint(0, len(self.real_df))
-        row = self.real_df.iloc[idx]
-        obs = np.concatenate([
-            np.array([float(row['model_pred'])], dtype=np.float32),
-            np.array([float(row['model_conf'])], dtype=np.float32),
-            np.array([float(row['missing_fields'])], dtype=np.float32),
-            doc_type_one_hot(int(row['doc_type_idx'])),
-            np.array([float(row['hist_success'])], dtype=np.float32)
-        ])
-        true_label = int(row['label'])
+    def _sample_from_real(self):
+        idx = self.rng.randint(0, len(self.real_labels))
+        obs = np.array(self.real_obs[idx], dtype=np.float32)
+        true_label = int(self.real_labels[idx])
         return obs, true_label
 
     def reset(self):
-        if self.real_df is not None:
-            obs, label = self._sample_from_df()
+        if self.real_obs is not None:
+            obs, label = self._sample_from_real()
         else:
             obs, label = self._sample_synthetic()
         self.current = {"obs": obs, "label": label}
@@ -0,0 +1,179 @@
+# sweep.py
+import os
+import csv
+import json
+import time
+import itertools
+import traceback
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+
+ALGORITHMS = ("ppo", "sac")
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+RESULT_FIELDS = ["algo", "seed", "params", "n_envs", "total_timesteps", "train_seconds", "steps_per_sec",
+                 "final_reward", "eval_reward", "eval_pass_rate", "eval_false_pass_rate", "eval_review_rate", "error"]
+
+def _available_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _pin_worker(worker_counter, cpus_per_worker, threads_per_worker):
+    """
+    Pool initializer: gives every worker its own slice of `cpus_per_worker` CPUs (inherited by
+    SubprocVecEnv children) and caps torch's thread pool, so concurrent trials don't oversubscribe
+    the machine. The BLAS pools are sized at numpy import, before this runs, so sweep() caps them
+    through the environment.
+    """
+    with worker_counter.get_lock():
+        worker_idx = worker_counter.value
+        worker_counter.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        start = (worker_idx * cpus_per_worker) % len(cpus)
+        os.sched_setaffinity(0, cpus[start:start + cpus_per_worker] or cpus)
+    import torch
+    torch.set_num_threads(threads_per_worker)
+
+def _make_env(algo, n_envs, seed, vec_env):
+    from r1_agent.env import DocumentComplianceEnv, DocumentComplianceEnvContinuous
+    from r1_agent.vec_env import BatchedDocumentComplianceVecEnv, BatchedDocumentComplianceVecEnvContinuous
+    if vec_env == "batched":
+        batched = BatchedDocumentComplianceVecEnv if algo == "ppo" else BatchedDocumentComplianceVecEnvContinuous
+        return batched(num_envs=n_envs, seed=seed)
+    from stable_baselines3.common.vec_env import SubprocVecEnv
+    single = DocumentComplianceEnv if algo == "ppo" else DocumentComplianceEnvContinuous
+    return SubprocVecEnv([lambda i=i: single(seed=seed + i) for i in range(n_envs)])
+
+def evaluate(model, algo, n_episodes=2_000, seed=10_000, pass_threshold=0.7):
+    """Deterministic evaluation on fresh synthetic documents: mean reward and decision rates."""
+    from r1_agent.env import sample_synthetic_batch, binary_reward_batch, continuous_reward_batch
+    obs, labels = sample_synthetic_batch(np.random.RandomState(seed), n_episodes)
+    actions, _ = model.predict(obs, deterministic=True)
+    if algo == "ppo":
+        rewards = binary_reward_batch(actions, labels)
+        passed = np.asarray(actions).reshape(-1) == 1
+    else:
+        rewards, confs = continuous_reward_batch(actions, labels)
+        passed = confs >= pass_threshold
+    return {
+        "eval_reward": float(rewards.mean()),
+        "eval_pass_rate": float(passed.mean()),
+        "eval_false_pass_rate": float((passed & (labels == 0)).sum() / max((labels == 0).sum(), 1)),
+        "eval_review_rate": float((~passed).mean()),
+    }
+
+def run_trial(algo, seed, params, n_envs=4, total_timesteps=50_000, vec_env="batched"):
+    """Trains one (algorithm, seed, hyperparameters) combination and returns its result row."""
+    from stable_baselines3 import PPO, SAC
+    from stable_baselines3.common.vec_env import VecMonitor
+    row = {"algo": algo, "seed": seed, "params": json.dumps(params, sort_keys=True),
+           "n_envs": n_envs, "total_timesteps": total_timesteps, "error": ""}
+    env = None
+    try:
+        env = VecMonitor(_make_env(algo, n_envs, seed, vec_env))
+        model_cls = PPO if algo == "ppo" else SAC
+        model = model_cls("MlpPolicy", env, verbose=0, seed=seed, **params)
+        start = time.perf_counter()
+        model.learn(total_timesteps=total_timesteps)
+        elapsed = time.perf_counter() - start
+        row["train_seconds"] = elapsed
+        row["steps_per_sec"] = model.num_timesteps / elapsed
+        row["final_reward"] = float(np.mean([ep["r"] for ep in model.ep_info_buffer])) if model.ep_info_buffer else float("nan")
+        row.update(evaluate(model, algo))
+    except Exception:
+        row["error"] = traceback.format_exc()
+    finally:
+        # a failed SubprocVecEnv would otherwise leave its children running in the pool worker
+        if env is not None:
+            try:
+                env.close()
+            except Exception:
+                row["error"] += traceback.format_exc()
+    return row
+
+def expand_grid(algos, seeds, grid):
+    """grid: {algo: {param: [values, ...]}} -> list of (algo, seed, params) trials."""
+    trials = []
+    for algo in algos:
+        if algo not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algo!r}, expected one of {ALGORITHMS}")
+        algo_grid = grid.get(algo, {})
+        keys = sorted(algo_grid)
+        for values in itertools.product(*(algo_grid[k] for k in keys)):
+            for seed in seeds:
+                trials.append((algo, seed, dict(zip(keys, values))))
+    return trials
+
+def write_results(rows, results_path):
+    os.makedirs(os.path.dirname(results_path) or ".", exist_ok=True)
+    with open(results_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def append_result(row, results_path):
+    with open(results_path, "a", newline="", encoding="utf-8") as f:
+        csv.DictWriter(f, fieldnames=RESULT_FIELDS).writerow(row)
+
+def print_results(rows):
+    print(f"{'algo':<4} {'seed':>5} {'steps/s':>10} {'final_r':>8} {'eval_r':>8} {'false_pass':>10}  params")
+    for r in rows:
+        if r["error"]:
+            print(f"{r['algo']:<4} {r['seed']:>5}  FAILED: {r['error'].strip().splitlines()[-1]}  {r['params']}")
+            continue
+        print(f"{r['algo']:<4} {r['seed']:>5} {r['steps_per_sec']:>10,.0f} {r['final_reward']:>8.3f} "
+              f"{r['eval_reward']:>8.3f} {r['eval_false_pass_rate']:>10.3f}  {r['params']}")
+
+def sweep(algos=ALGORITHMS, seeds=(0, 1, 2), grid=None, n_envs=4, total_timesteps=50_000,
+          vec_env="batched", n_workers=None, threads_per_worker=1, results_path="results/sweep.csv"):
+    """
+    Fans out (algorithm, seed, hyperparameter) trials over a process pool on this machine.
+    vec_env: "batched" (BatchedDocumentComplianceVecEnv) or "subproc" (SubprocVecEnv of single envs).
+    Rows are appended to results_path as trials finish, then rewritten sorted at the end.
+    """
+    grid = grid or {"ppo": {"learning_rate": [3e-4, 1e-3]}, "sac": {"learning_rate": [3e-4, 1e-3]}}
+    trials = expand_grid(algos, seeds, grid)
+    # in subproc mode each trial also runs n_envs env processes inside its CPU slice
+    cpus_per_worker = max(threads_per_worker, n_envs) if vec_env == "subproc" else threads_per_worker
+    if n_workers is None:
+        n_workers = max(1, _available_cpus() // cpus_per_worker)
+    ctx = mp.get_context("spawn")
+    worker_counter = ctx.Value("i", 0)
+    rows = []
+    write_results(rows, results_path)
+    # spawned workers inherit the environment and import numpy before the initializer runs,
+    # so the BLAS thread caps have to be in place before the pool starts
+    saved_env = {var: os.environ.get(var) for var in THREAD_ENV_VARS}
+    os.environ.update({var: str(threads_per_worker) for var in THREAD_ENV_VARS})
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx, initializer=_pin_worker,
+                                 initargs=(worker_counter, cpus_per_worker, threads_per_worker)) as pool:
+            futures = {pool.submit(run_trial, algo, seed, params, n_envs, total_timesteps, vec_env): (algo, seed, params)
+                       for algo, seed, params in trials}
+            for future in as_completed(futures):
+                try:
+                    row = future.result()
+                except Exception:
+                    # e.g. BrokenProcessPool when a worker dies: record it and keep the finished trials
+                    algo, seed, params = futures[future]
+                    row = {"algo": algo, "seed": seed, "params": json.dumps(params, sort_keys=True),
+                           "n_envs": n_envs, "total_timesteps": total_timesteps, "error": traceback.format_exc()}
+                rows.append(row)
+                append_result(row, results_path)
+                print(f"Finished {row['algo']} seed={row['seed']} {row['params']}")
+    finally:
+        for var, value in saved_env.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+    rows.sort(key=lambda r: (r["algo"], r["params"], r["seed"]))
+    write_results(rows, results_path)
+    print_results(rows)
+    print(f"Saved results to {results_path}")
+    return rows
+
+if __name__ == "__main__":
+    sweep()
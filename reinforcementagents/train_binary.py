@@ -3,10 +3,15 @@ import os
 from stable_baselines3 import PPO
 from stable_baselines3.common.vec_env import DummyVecEnv
 from r1_agent.env import DocumentComplianceEnv
+from r1_agent.vec_env import BatchedDocumentComplianceVecEnv
 
-def train(save_path="models/binary_agent.zip", total_timesteps=50_000, seed=42):
+def train(save_path="models/binary_agent.zip", total_timesteps=50_000, seed=42, n_envs=1):
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    env = DummyVecEnv([lambda: DocumentComplianceEnv(seed=seed)])
+    if n_envs == 1:
+        # a single scalar env is cheaper per step than a batch of one (see benchmark_env.py)
+        env = DummyVecEnv([lambda: DocumentComplianceEnv(seed=seed)])
+    else:
+        env = BatchedDocumentComplianceVecEnv(num_envs=n_envs, seed=seed)
     model = PPO("MlpPolicy", env, verbose=1, seed=seed)
     model.learn(total_timesteps=total_timesteps)
     model.save(save_path)
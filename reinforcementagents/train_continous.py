@@ -3,10 +3,15 @@ import os
 from stable_baselines3 import SAC
 from stable_baselines3.common.vec_env import DummyVecEnv
 from r1_agent.env import DocumentComplianceEnvContinuous
+from r1_agent.vec_env import BatchedDocumentComplianceVecEnvContinuous
 
-def train(save_path="models/continuous_agent.zip", total_timesteps=100_000, seed=0):
+def train(save_path="models/continuous_agent.zip", total_timesteps=100_000, seed=0, n_envs=1):
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    env = DummyVecEnv([lambda: DocumentComplianceEnvContinuous(seed=seed)])
+    if n_envs == 1:
+        # a single scalar env is cheaper per step than a batch of one (see benchmark_env.py)
+        env = DummyVecEnv([lambda: DocumentComplianceEnvContinuous(seed=seed)])
+    else:
+        env = BatchedDocumentComplianceVecEnvContinuous(num_envs=n_envs, seed=seed)
     model = SAC("MlpPolicy", env, verbose=1, seed=seed)
     model.learn(total_timesteps=total_timesteps)
     model.save(save_path)
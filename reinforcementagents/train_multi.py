@@ -1,7 +1,12 @@
 # inference.py
+import os
+import time
+import threading
 import numpy as np
 from stable_baselines3 import PPO, SAC
-from r1_agent.env import doc_type_one_hot
+from r1_agent.env import DOC_TYPES, doc_type_one_hot, build_observation_array
+
+MULTI_ACTIONS = {0: "approve", 1: "reject", 2: "request_more_info", 3: "human_review"}
 
 def build_observation(model_pred, model_conf, missing_fields, doc_type_str, hist_success, n_missing_fields_max=10):
     missing_norm = min(missing_fields, n_missing_fields_max) / n_missing_fields_max
@@ -19,26 +24,113 @@ def build_observation(model_pred, model_conf, missing_fields, doc_type_str, hist
     ])
     return obs
 
-def inference_binary(model_path, obs):
-    model = PPO.load(model_path)
-    action, _ = model.predict(obs, deterministic=True)
+def build_observation_batch(model_pred, model_conf, missing_fields, doc_type_str, hist_success, n_missing_fields_max=10):
+    """
+    Vectorized build_observation: every argument is a length-N sequence, returns an (N, OBS_DIM) float32 array.
+    """
+    doc_type_idx = [DOC_TYPES.index(d) if d in DOC_TYPES else 0 for d in doc_type_str]
+    missing_norm = np.minimum(np.asarray(missing_fields, dtype=np.float32), n_missing_fields_max) / n_missing_fields_max
+    return build_observation_array(
+        np.asarray(model_pred, dtype=np.float32),
+        np.asarray(model_conf, dtype=np.float32),
+        missing_norm,
+        doc_type_idx,
+        np.asarray(hist_success, dtype=np.float32),
+    )
+
+class PolicyRegistry:
+    """
+    Long-lived cache of loaded policies, keyed by model path.
+    Each model is loaded once and reloaded only when its file changes on disk
+    (checked at most every `check_interval` seconds). If a reload fails, e.g. on a
+    half-written file, the previously loaded model keeps being served.
+    """
+
+    def __init__(self, check_interval=1.0):
+        self.check_interval = check_interval
+        self._models = {}
+        self._path_locks = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, entry, algo, now):
+        return entry is not None and entry["algo"] is algo and now - entry["checked_at"] < self.check_interval
+
+    def get(self, model_path, algo=PPO):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._models.get(model_path)
+            if self._fresh(entry, algo, now):
+                return entry["model"]
+            path_lock = self._path_locks.setdefault(model_path, threading.Lock())
+        # reloads only hold this path's lock, so a slow load doesn't stall predictions on other models
+        with path_lock:
+            entry = self._models.get(model_path)
+            if self._fresh(entry, algo, now):
+                return entry["model"]  # another thread reloaded it while we waited
+            try:
+                mtime = os.path.getmtime(model_path)
+                if entry is None or entry["mtime"] != mtime or entry["algo"] is not algo:
+                    entry = {"model": algo.load(model_path), "algo": algo, "mtime": mtime}
+            except Exception:
+                # e.g. BadZipFile, or the file briefly missing, while a trainer is still saving in place:
+                # keep serving the cached model and leave its mtime alone so the next poll retries
+                if entry is None or entry["algo"] is not algo:
+                    raise
+            entry["checked_at"] = now
+            with self._lock:
+                self._models[model_path] = entry
+            return entry["model"]
+
+    def predict(self, model_path, obs, algo=PPO, deterministic=True):
+        """Predicts actions for a single observation or an (N, OBS_DIM) batch."""
+        model = self.get(model_path, algo)
+        action, _ = model.predict(np.asarray(obs, dtype=np.float32), deterministic=deterministic)
+        return action
+
+    def evict(self, model_path=None):
+        with self._lock:
+            if model_path is None:
+                self._models.clear()
+                self._path_locks.clear()
+            else:
+                self._models.pop(model_path, None)
+                self._path_locks.pop(model_path, None)
+
+default_registry = PolicyRegistry()
+
+def inference_binary(model_path, obs, registry=default_registry):
+    action = registry.predict(model_path, obs, algo=PPO)
     decision = "human_review" if int(action) == 0 else "pass"
     return decision, int(action)
 
-def inference_continuous(model_path, obs, pass_threshold=0.7):
-    model = SAC.load(model_path)
-    action, _ = model.predict(obs, deterministic=True)
+def inference_continuous(model_path, obs, pass_threshold=0.7, registry=default_registry):
+    action = registry.predict(model_path, obs, algo=SAC)
     conf = float(action[0])
     decision = "pass" if conf >= pass_threshold else "human_review"
     return decision, conf
 
-def inference_multi(model_path, obs):
-    model = PPO.load(model_path)
-    action, _ = model.predict(obs, deterministic=True)
-    mapping = {0: "approve", 1: "reject", 2: "request_more_info", 3: "human_review"}
-    return mapping.get(int(action), "unknown"), int(action)
+def inference_multi(model_path, obs, registry=default_registry):
+    action = registry.predict(model_path, obs, algo=PPO)
+    return MULTI_ACTIONS.get(int(action), "unknown"), int(action)
+
+def inference_binary_batch(model_path, obs_batch, registry=default_registry):
+    actions = registry.predict(model_path, obs_batch, algo=PPO).astype(np.int64)
+    decisions = np.where(actions == 0, "human_review", "pass")
+    return decisions.tolist(), actions
+
+def inference_continuous_batch(model_path, obs_batch, pass_threshold=0.7, registry=default_registry):
+    confs = registry.predict(model_path, obs_batch, algo=SAC).reshape(-1)
+    decisions = np.where(confs >= pass_threshold, "pass", "human_review")
+    return decisions.tolist(), confs
+
+def inference_multi_batch(model_path, obs_batch, registry=default_registry):
+    actions = registry.predict(model_path, obs_batch, algo=PPO).astype(np.int64)
+    decisions = [MULTI_ACTIONS.get(int(a), "unknown") for a in actions]
+    return decisions, actions
 
 if __name__ == "__main__":
     # simple demo
     obs = build_observation(model_pred=1, model_conf=0.85, missing_fields=1, doc_type_str="invoice", hist_success=0.9)
     print("Obs shape:", obs.shape)
+    obs_batch = build_observation_batch([1, 0], [0.85, 0.3], [1, 4], ["invoice", "po"], [0.9, 0.4])
+    print("Batch obs shape:", obs_batch.shape)
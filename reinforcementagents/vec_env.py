@@ -0,0 +1,134 @@
+# vec_env.py
+import numpy as np
+from gym import spaces
+from stable_baselines3.common.vec_env import VecEnv
+from r1_agent.env import (
+    OBS_DIM,
+    sample_synthetic_batch,
+    binary_reward_batch,
+    continuous_reward_batch,
+)
+from r1_agent.dataset import load_real_dataset, sample_batch
+
+# info["outcome"] of DocumentComplianceEnv.step, indexed by action (anything else is invalid)
+_OUTCOMES = ("human_reviewed", "passed")
+
+class _BatchedComplianceVecEnv(VecEnv):
+    """
+    Natively batched version of the one-step compliance envs.
+    All `num_envs` sub-environments are sampled together as NumPy arrays and
+    rewards are computed in vectorized form, so there is no per-env Python loop.
+    Every step ends the episode, so each step returns the freshly reset observations
+    and the finished ones under info["terminal_observation"] (as DummyVecEnv does).
+    """
+    metadata = {"render.modes": []}
+
+    def __init__(self, num_envs, action_space, n_missing_fields_max=10, seed: int = 0, use_real_data=None):
+        observation_space = spaces.Box(low=0.0, high=1.0, shape=(OBS_DIM,), dtype=np.float32)
+        super().__init__(num_envs, observation_space, action_space)
+        self.n_missing_fields_max = n_missing_fields_max
+        self.rng = np.random.RandomState(seed)
+        self.use_real_data = use_real_data
+        self.real_obs = None
+        self.real_labels = None
+        if use_real_data is not None:
+            self.real_obs, self.real_labels = load_real_dataset(use_real_data, n_missing_fields_max)
+        self.obs = np.zeros((num_envs, OBS_DIM), dtype=np.float32)
+        self.labels = np.zeros(num_envs, dtype=np.int64)
+        self.actions = None
+
+    def _sample(self):
+        if self.real_obs is not None:
+            return sample_batch(self.rng, self.real_obs, self.real_labels, self.num_envs)
+        return sample_synthetic_batch(self.rng, self.num_envs, self.n_missing_fields_max)
+
+    def _rewards(self, actions):
+        raise NotImplementedError
+
+    def _infos(self, actions, terminal_obs):
+        raise NotImplementedError
+
+    def reset(self):
+        self.obs, self.labels = self._sample()
+        return self.obs.copy()
+
+    def step_async(self, actions):
+        self.actions = actions
+
+    def step_wait(self):
+        rewards, actions = self._rewards(self.actions)
+        terminal_obs = self.obs
+        infos = self._infos(actions, terminal_obs)
+        dones = np.ones(self.num_envs, dtype=bool)  # one-step episodic environment
+        self.obs, self.labels = self._sample()
+        return self.obs.copy(), rewards, dones, infos
+
+    def seed(self, seed=None):
+        self.rng = np.random.RandomState(seed)
+        return [seed] * self.num_envs
+
+    def close(self):
+        pass
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self, attr_name)] * len(self._get_indices(indices))
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        result = getattr(self, method_name)(*method_args, **method_kwargs)
+        return [result] * len(self._get_indices(indices))
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False] * len(self._get_indices(indices))
+
+    def _get_indices(self, indices):
+        if indices is None:
+            return range(self.num_envs)
+        if isinstance(indices, int):
+            return [indices]
+        return indices
+
+class BatchedDocumentComplianceVecEnv(_BatchedComplianceVecEnv):
+    """
+    Batched DocumentComplianceEnv:
+      - actions: 0 -> request human review, 1 -> pass (one per sub-env)
+    Same observation and reward as DocumentComplianceEnv.
+    """
+
+    def __init__(self, num_envs=1, n_missing_fields_max=10, seed: int = 0, use_real_data=None):
+        super().__init__(num_envs, spaces.Discrete(2), n_missing_fields_max, seed, use_real_data)
+
+    def _rewards(self, actions):
+        actions = np.asarray(actions).reshape(-1)
+        return binary_reward_batch(actions, self.labels), actions
+
+    def _infos(self, actions, terminal_obs):
+        labels = self.labels.tolist()
+        return [
+            {"outcome": _OUTCOMES[a] if a in (0, 1) else "invalid_action", "true_label": labels[i],
+             "terminal_observation": terminal_obs[i]}
+            for i, a in enumerate(actions.tolist())
+        ]
+
+class BatchedDocumentComplianceVecEnvContinuous(_BatchedComplianceVecEnv):
+    """
+    Batched DocumentComplianceEnvContinuous:
+      - action: confidence score in [0,1] per sub-env, shape (num_envs, 1)
+    Same observation and reward as DocumentComplianceEnvContinuous.
+    """
+
+    def __init__(self, num_envs=1, n_missing_fields_max=10, seed: int = 0, use_real_data=None):
+        action_space = spaces.Box(low=0.0, high=1.0, shape=(1,), dtype=np.float32)
+        super().__init__(num_envs, action_space, n_missing_fields_max, seed, use_real_data)
+
+    def _rewards(self, actions):
+        return continuous_reward_batch(actions, self.labels)
+
+    def _infos(self, actions, terminal_obs):
+        labels = self.labels.tolist()
+        return [
+            {"action_confidence": a, "true_label": labels[i], "terminal_observation": terminal_obs[i]}
+            for i, a in enumerate(actions.tolist())
+        ]
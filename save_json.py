@@ -32,15 +32,20 @@ def save_document_data(doc_type, new_data, output_folder):
             
             existing_data[existing_index] = new_data
             print(f"♻️ Updated existing {doc_type} with {unique_key}={new_data.get(unique_key)}")
+            action = "updated"
         else:
            
             existing_data.append(new_data)
             print(f"➕ Added new {doc_type} with {unique_key}={new_data.get(unique_key)}")
+            action = "added"
     else:
         
         existing_data.append(new_data)
         print(f"➕ Added new {doc_type} (no unique key)")
+        action = "added"
 
     
     with open(file_path, 'w', encoding='utf-8') as f:
         json.dump(existing_data, f, indent=4)
+
+    return action